@@ -1,13 +1,28 @@
 import pygame
 import pygame.locals
 import numpy as np
-import math
+import ctypes
+from math import sin, cos, tan, radians, degrees, pi
+import time
+from random import random as _rand
 from OpenGL.GL import *
 from OpenGL.GLU import *
 
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the physics step runs as plain Python
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
 # Constants
 WIDTH, HEIGHT = 1024, 768
 FPS = 60
+PHYS_DT = 1 / 120  # Fixed physics timestep in seconds
+MAX_FRAME_TIME = 0.25  # Clamp on real frame time to avoid a spiral of death
+THROTTLE_RATE = 0.6  # Throttle change per second while a key is held
 FOV = 60  # Field of view in degrees
 
 # Colors
@@ -31,6 +46,7 @@ CESSNA_MAX_ALTITUDE = 14000  # feet
 CESSNA_ROLL_RATE = 60  # degrees per second
 CESSNA_PITCH_RATE = 25  # degrees per second
 CESSNA_YAW_RATE = 20  # degrees per second
+CESSNA_IDLE_RPM = 500  # engine RPM at idle throttle
 
 # KIND Airport location (Indianapolis International Airport)
 KIND_LAT = 39.7173
@@ -41,117 +57,207 @@ KIND_ELEVATION = 797  # feet above sea level
 FEET_TO_METERS = 0.3048
 KNOTS_TO_MPS = 0.51444
 
+# Derived constants in SI units, precomputed for the hot paths
+KIND_ELEV_M = KIND_ELEVATION * FEET_TO_METERS  # meters
+STALL_MPS = CESSNA_STALL_SPEED * KNOTS_TO_MPS
+STALL_MPS_09 = STALL_MPS * 0.9  # stall onset
+STALL_MPS_11 = STALL_MPS * 1.1  # stall warning threshold
+CRUISE_MPS = CESSNA_CRUISE_SPEED * KNOTS_TO_MPS
+MAX_MPS = CESSNA_MAX_SPEED * KNOTS_TO_MPS
+CLIMB_MPS = CESSNA_CLIMB_RATE * FEET_TO_METERS / 60
+DESCENT_MPS = CESSNA_DESCENT_RATE * FEET_TO_METERS / 60
+
+# Unit circle shared by all instrument outlines; the last point closes the ring
+INSTRUMENT_SEGMENTS = 20
+_RING = [(cos(2 * pi * i / INSTRUMENT_SEGMENTS), sin(2 * pi * i / INSTRUMENT_SEGMENTS))
+         for i in range(INSTRUMENT_SEGMENTS + 1)]
+
+# Physics
+GRAVITY = 9.8  # meters per second squared
+
+# Aircraft state vector layout
+STATE_X, STATE_Y, STATE_Z = 0, 1, 2
+STATE_PITCH, STATE_ROLL, STATE_HEADING = 3, 4, 5
+STATE_AIRSPEED, STATE_VERTICAL_SPEED = 6, 7
+STATE_RPM, STATE_FUEL = 8, 9
+STATE_SIZE = 10
+
+def state_property(index):
+    # Expose one entry of Aircraft.state as an attribute
+    def getter(self):
+        return self.state[index]
+    def setter(self, value):
+        self.state[index] = value
+    return property(getter, setter)
+
+def _zyx(cr, sr, cp, sp, ch, sh):
+    # Closed form of R_roll @ R_pitch @ R_heading from the cosines and sines
+    # of each angle, as a row-major 9-tuple
+    return (cr * ch + sr * sp * sh, sr * cp, sr * sp * ch - cr * sh,
+            cr * sp * sh - sr * ch, cr * cp, sr * sh + cr * sp * ch,
+            cp * sh, -sp, cp * ch)
+
 class Aircraft:
+    # Position
+    x = state_property(STATE_X)  # East position in meters
+    y = state_property(STATE_Y)  # Altitude in meters
+    z = state_property(STATE_Z)  # North position in meters
+    
+    # Orientation (in degrees)
+    pitch = state_property(STATE_PITCH)
+    roll = state_property(STATE_ROLL)
+    heading = state_property(STATE_HEADING)
+    
+    # Velocity
+    airspeed = state_property(STATE_AIRSPEED)  # meters per second
+    vertical_speed = state_property(STATE_VERTICAL_SPEED)  # meters per second
+    
+    # Engine
+    rpm = state_property(STATE_RPM)
+    fuel = state_property(STATE_FUEL)  # percent
+    
     def __init__(self):
-        # Position
-        self.x = 0  # East position in meters
-        self.y = KIND_ELEVATION * FEET_TO_METERS  # Altitude in meters
-        self.z = 0  # North position in meters
-        
-        # Orientation (in degrees)
-        self.pitch = 0
-        self.roll = 0
-        self.heading = 0
-        
-        # Velocity
-        self.airspeed = 0  # meters per second
-        self.vertical_speed = 0  # meters per second
+        # Flat state vector stepped by _step
+        self.state = np.zeros(STATE_SIZE, dtype=np.float64)
+        self.y = KIND_ELEV_M
+        self.fuel = 100
         
         # Controls
-        self.throttle = 0  # 0 to 1
-        self.elevator = 0  # -1 to 1
-        self.aileron = 0  # -1 to 1
-        self.rudder = 0  # -1 to 1
+        self.throttle = 0.0  # 0 to 1
+        self.elevator = 0.0  # -1 to 1
+        self.aileron = 0.0  # -1 to 1
+        self.rudder = 0.0  # -1 to 1
         self.flaps = 0  # 0 to 3 (0, 10, 20, 30 degrees)
         
-        # Engine
-        self.rpm = 0
-        self.fuel = 100  # percent
-        
         # Landing gear
         self.gear_down = True
+        
+        # Run one throwaway step with the argument types used in flight, so
+        # numba compiles (or loads from cache) while loading, not mid-flight
+        self._step(self.state, 0.0, 0.0, 0.0, 0.0, PHYS_DT)
 
     def update(self, dt):
+        self.state = self._step(self.state, self.throttle, self.elevator, self.aileron, self.rudder, dt)
+
+    @staticmethod
+    @njit(cache=True, fastmath=True)
+    def _step(state, throttle, elevator, aileron, rudder, dt):
+        # Advance the state vector by dt and return the new state
+        x = state[STATE_X]
+        y = state[STATE_Y]
+        z = state[STATE_Z]
+        pitch = state[STATE_PITCH]
+        roll = state[STATE_ROLL]
+        heading = state[STATE_HEADING]
+        airspeed = state[STATE_AIRSPEED]
+        vertical_speed = state[STATE_VERTICAL_SPEED]
+        rpm = state[STATE_RPM]
+        fuel = state[STATE_FUEL]
+        
+        # Parked on the ground at idle throttle with controls centered
+        parked = (airspeed == 0.0 and throttle == 0.0 and y <= KIND_ELEV_M
+                  and abs(elevator) + abs(aileron) + abs(rudder) < 1e-3)
+        
         # Update position based on velocity and orientation
-        heading_rad = math.radians(self.heading)
-        pitch_rad = math.radians(self.pitch)
+        heading_rad = radians(heading)
+        pitch_rad = radians(pitch)
         
         # Calculate velocity components
-        dx = self.airspeed * math.sin(heading_rad) * math.cos(pitch_rad)
-        dy = self.airspeed * math.sin(pitch_rad)
-        dz = self.airspeed * math.cos(heading_rad) * math.cos(pitch_rad)
+        dx = airspeed * sin(heading_rad) * cos(pitch_rad)
+        dy = airspeed * sin(pitch_rad)
+        dz = airspeed * cos(heading_rad) * cos(pitch_rad)
         
         # Update position
-        self.x += dx * dt
-        self.y += dy * dt
-        self.z += dz * dt
+        x += dx * dt
+        y += dy * dt
+        z += dz * dt
         
         # Ground collision check
-        if self.y < KIND_ELEVATION * FEET_TO_METERS:
-            self.y = KIND_ELEVATION * FEET_TO_METERS
-            self.vertical_speed = 0
-            self.pitch = max(0, self.pitch)
+        if y < KIND_ELEV_M:
+            y = KIND_ELEV_M
+            vertical_speed = 0.0
+            pitch = max(0.0, pitch)
         
         # Apply control inputs
-        self.roll += self.aileron * CESSNA_ROLL_RATE * dt
-        self.pitch += self.elevator * CESSNA_PITCH_RATE * dt
-        self.heading += self.rudder * CESSNA_YAW_RATE * dt
+        roll += aileron * CESSNA_ROLL_RATE * dt
+        pitch += elevator * CESSNA_PITCH_RATE * dt
+        heading += rudder * CESSNA_YAW_RATE * dt
         
-        # Apply banking effect on heading
-        self.heading += math.sin(math.radians(self.roll)) * dt * 10
+        # Coordinated turn: heading rate is g * tan(bank) / airspeed.
+        # Airspeed is floored at stall speed to keep the rate bounded on the ground.
+        turn_speed = max(airspeed, STALL_MPS)
+        heading += degrees(GRAVITY * tan(radians(roll)) / turn_speed) * dt
         
         # Normalize heading to 0-360
-        self.heading %= 360
+        heading %= 360
         
         # Limit pitch and roll
-        self.pitch = max(-30, min(30, self.pitch))
-        self.roll = max(-60, min(60, self.roll))
+        pitch = max(-30.0, min(30.0, pitch))
+        roll = max(-60.0, min(60.0, roll))
         
         # Apply throttle
-        target_airspeed = self.throttle * CESSNA_MAX_SPEED * KNOTS_TO_MPS
-        airspeed_diff = target_airspeed - self.airspeed
-        self.airspeed += airspeed_diff * dt * 0.5
+        target_airspeed = throttle * MAX_MPS
+        airspeed_diff = target_airspeed - airspeed
+        airspeed += airspeed_diff * dt * 0.5
         
         # Update RPM based on throttle
-        target_rpm = 500 + self.throttle * 2300  # Cessna 172 has max RPM of ~2800
-        rpm_diff = target_rpm - self.rpm
-        self.rpm += rpm_diff * dt * 2
+        target_rpm = CESSNA_IDLE_RPM + throttle * 2300  # Cessna 172 has max RPM of ~2800
+        rpm_diff = target_rpm - rpm
+        rpm += rpm_diff * dt * 2
         
         # Update vertical speed based on pitch and airspeed
-        target_vs = 0
-        if self.pitch > 0:
+        target_vs = 0.0
+        if pitch > 0:
             # Climb rate depends on airspeed and pitch
-            pitch_factor = self.pitch / 10  # normalized pitch effect
-            speed_factor = min(1.0, self.airspeed / (CESSNA_CRUISE_SPEED * KNOTS_TO_MPS))
-            target_vs = CESSNA_CLIMB_RATE * FEET_TO_METERS / 60 * pitch_factor * speed_factor
-        elif self.pitch < 0:
+            pitch_factor = pitch / 10  # normalized pitch effect
+            speed_factor = min(1.0, airspeed / CRUISE_MPS)
+            target_vs = CLIMB_MPS * pitch_factor * speed_factor
+        elif pitch < 0:
             # Descent rate depends on pitch (negative)
-            pitch_factor = abs(self.pitch) / 10
-            target_vs = CESSNA_DESCENT_RATE * FEET_TO_METERS / 60 * pitch_factor
+            pitch_factor = abs(pitch) / 10
+            target_vs = DESCENT_MPS * pitch_factor
         
         # Smoothly adjust vertical speed
-        vs_diff = target_vs - self.vertical_speed
-        self.vertical_speed += vs_diff * dt * 0.5
+        vs_diff = target_vs - vertical_speed
+        vertical_speed += vs_diff * dt * 0.5
         
         # Fuel consumption
-        self.fuel -= self.throttle * dt * 0.05  # Simple fuel consumption model
-        self.fuel = max(0, self.fuel)
+        fuel -= throttle * dt * 0.05  # Simple fuel consumption model
+        fuel = max(0.0, fuel)
         
         # If fuel is empty, reduce engine power
-        if self.fuel <= 0:
-            self.rpm = max(0, self.rpm - 500 * dt)
+        if fuel <= 0:
+            rpm = max(0.0, rpm - 500 * dt)
             
         # Natural tendency to level out
-        if abs(self.aileron) < 0.1:
-            self.roll *= 0.95  # Gradually reduce roll if not actively rolling
+        if abs(aileron) < 0.1:
+            roll *= 0.95  # Gradually reduce roll if not actively rolling
         
-        # Stall behavior (very simplified)
-        if self.airspeed < CESSNA_STALL_SPEED * KNOTS_TO_MPS * 0.9:
+        # Stall behavior (very simplified), which cannot happen while parked
+        if airspeed < STALL_MPS_09 and not parked:
             # In a stall, the plane drops and might roll unpredictably
-            self.vertical_speed -= 9.8 * dt  # Gravity effect increases
-            if abs(self.roll) < 5:
+            vertical_speed -= GRAVITY * dt  # Gravity effect increases
+            if abs(roll) < 5:
                 # Add some random roll during stall
-                self.roll += (np.random.random() - 0.5) * 10 * dt
+                roll += (_rand() - 0.5) * 10 * dt
+        
+        next_state = np.empty(STATE_SIZE)
+        next_state[STATE_X] = x
+        next_state[STATE_Y] = y
+        next_state[STATE_Z] = z
+        next_state[STATE_PITCH] = pitch
+        next_state[STATE_ROLL] = roll
+        next_state[STATE_HEADING] = heading
+        next_state[STATE_AIRSPEED] = airspeed
+        next_state[STATE_VERTICAL_SPEED] = vertical_speed
+        next_state[STATE_RPM] = rpm
+        next_state[STATE_FUEL] = fuel
+        return next_state
+
+    def snapshot(self):
+        # Capture the pose (x, y, z, pitch, roll, heading) used to interpolate
+        # between physics steps
+        return self.state[STATE_X:STATE_HEADING + 1].copy()
 
 class FlightSimulator:
     def __init__(self):
@@ -164,14 +270,15 @@ class FlightSimulator:
         self.font = pygame.font.SysFont(None, 24)
         self.paused = False
         
-        # Camera
-        self.eye_offset = np.array([0, 0.1, -0.3])  # Pilot's eye position relative to aircraft origin
-        
         # Mouse controls
         self.mouse_sensitivity = 0.1
         pygame.mouse.set_visible(False)
         pygame.mouse.set_pos((WIDTH // 2, HEIGHT // 2))
         
+        # A hidden, grabbed cursor reports unbounded relative motion, so the
+        # mouse never needs recentering
+        pygame.event.set_grab(True)
+        
         # Initialize OpenGL
         glEnable(GL_DEPTH_TEST)
         glMatrixMode(GL_PROJECTION)
@@ -190,264 +297,468 @@ class FlightSimulator:
         self.aircraft.x = 500  # Start a bit down the runway
         self.aircraft.z = 0
         self.aircraft.heading = 230  # Runway heading
+        
+        # Pose before the most recent physics step, for render interpolation
+        self.previous_state = self.aircraft.snapshot()
 
     def create_world(self):
         # Create the airport and surrounding terrain
         # This is a simplified representation
         
+        # Create terrain
+        terrain_size = 20000  # meters
+        grid_size = 1000  # meters
+        
+        # Grid cell corners, indexed [x, z]
+        xs = np.arange(-terrain_size, terrain_size, grid_size)
+        X, Z = np.meshgrid(xs, xs, indexing='ij')
+        
+        # Vary terrain height a bit for visual interest (one height per grid point).
+        # Heights come from a hash of each point's coordinates, so the terrain
+        # is the same every launch and any patch can be regenerated on its own.
+        points = np.arange(-terrain_size, terrain_size + grid_size, grid_size).astype(np.uint32)
+        PX, PZ = np.meshgrid(points, points, indexing='ij')
+        noise = PX * np.uint32(2654435761) ^ PZ * np.uint32(40503)
+        noise ^= noise >> np.uint32(15)
+        noise *= np.uint32(0x2C1B3C6D)
+        noise ^= noise >> np.uint32(16)
+        H = (noise & np.uint32(0xFFFF)).astype(np.float32) * (10.0 / 65536.0) - 5.0
+        corner_heights = (H[:-1, :-1], H[1:, :-1], H[1:, 1:], H[:-1, 1:])
+        
+        # Make terrain near airport flat
+        near_airport = X * X + Z * Z < 2000 * 2000  # squared distance, no sqrt needed
+        for h in corner_heights:
+            h[near_airport] = 0
+        
+        # Alternate colors for visual interest (green / lighter green)
+        green = np.where((((X + Z) // grid_size) & 1) == 0, 0.5, 0.6)
+        
+        # Build all quads at once as interleaved (x, y, z, r, g, b) vertices
+        terrain = np.zeros((len(xs), len(xs), 4, 6), dtype=np.float32)
+        terrain[..., 0] = np.stack([X, X + grid_size, X + grid_size, X], axis=-1)
+        terrain[..., 1] = KIND_ELEV_M + np.stack(corner_heights, axis=-1)
+        terrain[..., 2] = np.stack([Z, Z, Z + grid_size, Z + grid_size], axis=-1)
+        terrain[..., 4] = green[..., np.newaxis]
+        
+        # Upload once; the driver keeps the data in GPU memory
+        world_vertices = terrain.reshape(-1, 6)
+        self.world_vertex_count = len(world_vertices)
+        self.world_vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.world_vbo)
+        glBufferData(GL_ARRAY_BUFFER, world_vertices.nbytes, world_vertices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        
         # Create runway (approx. 5000 ft long, 100 ft wide)
         runway_length = 5000 * FEET_TO_METERS
         runway_width = 100 * FEET_TO_METERS
         
-        # Create runway as a display list for efficiency
-        self.runway_dl = glGenLists(1)
-        glNewList(self.runway_dl, GL_COMPILE)
-        
-        # Runway surface
-        glBegin(GL_QUADS)
-        glColor3f(0.3, 0.3, 0.3)  # Dark gray for runway
-        glVertex3f(-runway_width/2, KIND_ELEVATION * FEET_TO_METERS + 0.1, 0)
-        glVertex3f(runway_width/2, KIND_ELEVATION * FEET_TO_METERS + 0.1, 0)
-        glVertex3f(runway_width/2, KIND_ELEVATION * FEET_TO_METERS + 0.1, -runway_length)
-        glVertex3f(-runway_width/2, KIND_ELEVATION * FEET_TO_METERS + 0.1, -runway_length)
-        glEnd()
-        
-        # Runway markings (centerline)
-        glBegin(GL_QUADS)
-        glColor3f(1.0, 1.0, 1.0)  # White for markings
+        # A single quad with interleaved (x, y, z, u, v) vertices; u runs along
+        # the runway and v across it, and the markings come from the texture
+        runway_vertices = np.array([
+            (-runway_width/2, KIND_ELEV_M + 0.1, 0, 0, 0),
+            (runway_width/2, KIND_ELEV_M + 0.1, 0, 0, 1),
+            (runway_width/2, KIND_ELEV_M + 0.1, -runway_length, 1, 1),
+            (-runway_width/2, KIND_ELEV_M + 0.1, -runway_length, 1, 0),
+        ], dtype=np.float32)
+        self.runway_vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.runway_vbo)
+        glBufferData(GL_ARRAY_BUFFER, runway_vertices.nbytes, runway_vertices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        
+        self.runway_tex = self.create_runway_texture(runway_length, runway_width)
+
+    def create_runway_texture(self, runway_length, runway_width):
+        # Paint the runway surface and markings into a texture, columns along
+        # the runway and rows across it
+        texture_length, texture_width = 2048, 128
+        along = (np.arange(texture_length) + 0.5) * runway_length / texture_length  # meters from the runway start
+        across = (np.arange(texture_width) + 0.5) * runway_width / texture_width - runway_width / 2  # meters from the centerline
+        C, A = np.meshgrid(across, along, indexing='ij')
         
-        # Draw dashed centerline
         dash_length = 50 * FEET_TO_METERS
         dash_width = 2 * FEET_TO_METERS
-        for i in range(0, int(runway_length), int(dash_length * 2)):
-            glVertex3f(-dash_width/2, KIND_ELEVATION * FEET_TO_METERS + 0.2, -i)
-            glVertex3f(dash_width/2, KIND_ELEVATION * FEET_TO_METERS + 0.2, -i)
-            glVertex3f(dash_width/2, KIND_ELEVATION * FEET_TO_METERS + 0.2, -(i + dash_length))
-            glVertex3f(-dash_width/2, KIND_ELEVATION * FEET_TO_METERS + 0.2, -(i + dash_length))
-        
-        # Draw threshold marks
-        for i in range(-int(runway_width/2), int(runway_width/2), int(dash_width * 2)):
-            glVertex3f(i, KIND_ELEVATION * FEET_TO_METERS + 0.2, -100 * FEET_TO_METERS)
-            glVertex3f(i + dash_width, KIND_ELEVATION * FEET_TO_METERS + 0.2, -100 * FEET_TO_METERS)
-            glVertex3f(i + dash_width, KIND_ELEVATION * FEET_TO_METERS + 0.2, -200 * FEET_TO_METERS)
-            glVertex3f(i, KIND_ELEVATION * FEET_TO_METERS + 0.2, -200 * FEET_TO_METERS)
-        glEnd()
         
-        glEndList()
+        # Dashed centerline
+        dash_spacing = int(dash_length * 2)
+        centerline = (np.abs(C) < dash_width / 2) & (A % dash_spacing < dash_length)
         
-        # Create terrain
-        terrain_size = 20000  # meters
-        grid_size = 1000  # meters
+        # Threshold marks, one per meter across the runway
+        mark = np.floor(C)
+        threshold = ((C - mark < dash_width) & (mark >= -int(runway_width / 2)) & (mark < int(runway_width / 2))
+                     & (A >= 100 * FEET_TO_METERS) & (A < 200 * FEET_TO_METERS))
         
-        self.terrain_dl = glGenLists(1)
-        glNewList(self.terrain_dl, GL_COMPILE)
+        # Dark gray runway, white markings
+        pixels = np.full((texture_width, texture_length, 4), 255, dtype=np.uint8)
+        pixels[..., :3] = np.where((centerline | threshold)[..., np.newaxis], 255, 77)
         
-        glBegin(GL_QUADS)
-        for x in range(-terrain_size, terrain_size, grid_size):
-            for z in range(-terrain_size, terrain_size, grid_size):
-                # Randomize terrain height a bit for visual interest
-                h1 = np.random.random() * 10 - 5
-                h2 = np.random.random() * 10 - 5
-                h3 = np.random.random() * 10 - 5
-                h4 = np.random.random() * 10 - 5
-                
-                # Make terrain near airport flat
-                dist_to_airport = math.sqrt(x*x + z*z)
-                if dist_to_airport < 2000:
-                    h1 = h2 = h3 = h4 = 0
-                
-                # Alternate colors for visual interest
-                if (x + z) % (2 * grid_size) == 0:
-                    glColor3f(0.0, 0.5, 0.0)  # Green
-                else:
-                    glColor3f(0.0, 0.6, 0.0)  # Lighter green
-                
-                glVertex3f(x, KIND_ELEVATION * FEET_TO_METERS + h1, z)
-                glVertex3f(x + grid_size, KIND_ELEVATION * FEET_TO_METERS + h2, z)
-                glVertex3f(x + grid_size, KIND_ELEVATION * FEET_TO_METERS + h3, z + grid_size)
-                glVertex3f(x, KIND_ELEVATION * FEET_TO_METERS + h4, z + grid_size)
-        glEnd()
+        texture = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, texture)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, texture_length, texture_width, 0, GL_RGBA, GL_UNSIGNED_BYTE, pixels)
+        glGenerateMipmap(GL_TEXTURE_2D)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR_MIPMAP_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
+        glBindTexture(GL_TEXTURE_2D, 0)
+        return texture
+
+    def enable_vertex_arrays(self):
+        # Point the vertex and color arrays at the bound interleaved (x, y, z, r, g, b) buffer
+        stride = 6 * 4  # six float32 values per vertex
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(3, GL_FLOAT, stride, ctypes.c_void_p(0))
+        glColorPointer(3, GL_FLOAT, stride, ctypes.c_void_p(3 * 4))
+
+    def disable_vertex_arrays(self):
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+
+    def draw_world(self):
+        # Draw terrain from the interleaved VBO
+        glBindBuffer(GL_ARRAY_BUFFER, self.world_vbo)
+        self.enable_vertex_arrays()
+        
+        glDrawArrays(GL_QUADS, 0, self.world_vertex_count)
+        
+        self.disable_vertex_arrays()
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def draw_runway(self):
+        # Draw the runway as one textured quad
+        stride = 5 * 4  # five float32 values per vertex
+        glEnable(GL_TEXTURE_2D)
+        glBindTexture(GL_TEXTURE_2D, self.runway_tex)
+        glColor3f(1.0, 1.0, 1.0)
+        
+        glBindBuffer(GL_ARRAY_BUFFER, self.runway_vbo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+        glVertexPointer(3, GL_FLOAT, stride, ctypes.c_void_p(0))
+        glTexCoordPointer(2, GL_FLOAT, stride, ctypes.c_void_p(3 * 4))
         
-        glEndList()
+        glDrawArrays(GL_QUADS, 0, 4)
+        
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glDisable(GL_TEXTURE_2D)
 
     def create_cockpit(self):
-        # Create cockpit elements as a display list
-        self.cockpit_dl = glGenLists(1)
-        glNewList(self.cockpit_dl, GL_COMPILE)
+        # Create cockpit elements as an indexed VBO: each distinct vertex is
+        # stored once, and the line segments and panel quad index into it
+        vertices = []  # interleaved (x, y, z, r, g, b)
+        vertex_indices = {}
+        
+        def add_vertices(indices, color, points):
+            for point in points:
+                key = tuple(point) + color
+                if key not in vertex_indices:
+                    vertex_indices[key] = len(vertices)
+                    vertices.append(key)
+                indices.append(vertex_indices[key])
+        
+        lines = []
+        quads = []
         
         # Cockpit frame
-        glBegin(GL_LINES)
-        glColor3f(0.5, 0.5, 0.5)  # Gray
+        color = (0.5, 0.5, 0.5)  # Gray
         
         # Forward window frame
-        glVertex3f(-0.5, 0.3, -0.2)
-        glVertex3f(0.5, 0.3, -0.2)
-        glVertex3f(0.5, 0.3, -0.2)
-        glVertex3f(0.5, -0.1, -0.2)
-        glVertex3f(0.5, -0.1, -0.2)
-        glVertex3f(-0.5, -0.1, -0.2)
-        glVertex3f(-0.5, -0.1, -0.2)
-        glVertex3f(-0.5, 0.3, -0.2)
+        add_vertices(lines, color, [
+            (-0.5, 0.3, -0.2), (0.5, 0.3, -0.2),
+            (0.5, 0.3, -0.2), (0.5, -0.1, -0.2),
+            (0.5, -0.1, -0.2), (-0.5, -0.1, -0.2),
+            (-0.5, -0.1, -0.2), (-0.5, 0.3, -0.2),
+        ])
         
         # Side window frames
-        glVertex3f(-0.5, 0.3, -0.2)
-        glVertex3f(-0.7, 0.3, 0.0)
-        glVertex3f(-0.7, 0.3, 0.0)
-        glVertex3f(-0.7, -0.1, 0.0)
-        glVertex3f(-0.7, -0.1, 0.0)
-        glVertex3f(-0.5, -0.1, -0.2)
-        
-        glVertex3f(0.5, 0.3, -0.2)
-        glVertex3f(0.7, 0.3, 0.0)
-        glVertex3f(0.7, 0.3, 0.0)
-        glVertex3f(0.7, -0.1, 0.0)
-        glVertex3f(0.7, -0.1, 0.0)
-        glVertex3f(0.5, -0.1, -0.2)
-        glEnd()
+        add_vertices(lines, color, [
+            (-0.5, 0.3, -0.2), (-0.7, 0.3, 0.0),
+            (-0.7, 0.3, 0.0), (-0.7, -0.1, 0.0),
+            (-0.7, -0.1, 0.0), (-0.5, -0.1, -0.2),
+            
+            (0.5, 0.3, -0.2), (0.7, 0.3, 0.0),
+            (0.7, 0.3, 0.0), (0.7, -0.1, 0.0),
+            (0.7, -0.1, 0.0), (0.5, -0.1, -0.2),
+        ])
         
         # Control yoke
-        glBegin(GL_LINES)
-        glColor3f(0.2, 0.2, 0.2)  # Dark gray
+        color = (0.2, 0.2, 0.2)  # Dark gray
         
         # Yoke column
-        glVertex3f(0.0, -0.2, -0.2)
-        glVertex3f(0.0, -0.5, -0.4)
+        add_vertices(lines, color, [(0.0, -0.2, -0.2), (0.0, -0.5, -0.4)])
         
         # Yoke wheel
         for i in range(0, 360, 30):
-            angle1 = math.radians(i)
-            angle2 = math.radians(i + 30)
-            x1 = 0.1 * math.cos(angle1)
-            z1 = 0.1 * math.sin(angle1)
-            x2 = 0.1 * math.cos(angle2)
-            z2 = 0.1 * math.sin(angle2)
+            angle1 = radians(i)
+            angle2 = radians(i + 30)
+            x1 = 0.1 * cos(angle1)
+            z1 = 0.1 * sin(angle1)
+            x2 = 0.1 * cos(angle2)
+            z2 = 0.1 * sin(angle2)
             
-            glVertex3f(x1, -0.5, -0.4 + z1)
-            glVertex3f(x2, -0.5, -0.4 + z2)
-        glEnd()
+            add_vertices(lines, color, [(x1, -0.5, -0.4 + z1), (x2, -0.5, -0.4 + z2)])
         
         # Simple instrument panel
-        glBegin(GL_QUADS)
-        glColor3f(0.2, 0.2, 0.2)  # Dark gray
-        glVertex3f(-0.5, -0.1, -0.2)
-        glVertex3f(0.5, -0.1, -0.2)
-        glVertex3f(0.5, -0.6, -0.4)
-        glVertex3f(-0.5, -0.6, -0.4)
-        glEnd()
+        add_vertices(quads, color, [
+            (-0.5, -0.1, -0.2),
+            (0.5, -0.1, -0.2),
+            (0.5, -0.6, -0.4),
+            (-0.5, -0.6, -0.4),
+        ])
         
-        # Draw instrument outlines
-        glBegin(GL_LINES)
-        glColor3f(0.7, 0.7, 0.7)  # Light gray
+        # Instrument outlines
+        color = (0.7, 0.7, 0.7)  # Light gray
         
         # Airspeed indicator
-        self.draw_instrument_circle(-0.35, -0.25, -0.21, 0.1)
+        add_vertices(lines, color, self.instrument_circle(-0.35, -0.25, -0.21, 0.1))
         
         # Attitude indicator
-        self.draw_instrument_circle(-0.15, -0.25, -0.21, 0.1)
+        add_vertices(lines, color, self.instrument_circle(-0.15, -0.25, -0.21, 0.1))
         
         # Altimeter
-        self.draw_instrument_circle(0.05, -0.25, -0.21, 0.1)
+        add_vertices(lines, color, self.instrument_circle(0.05, -0.25, -0.21, 0.1))
         
         # Turn coordinator
-        self.draw_instrument_circle(0.25, -0.25, -0.21, 0.1)
+        add_vertices(lines, color, self.instrument_circle(0.25, -0.25, -0.21, 0.1))
         
         # Heading indicator
-        self.draw_instrument_circle(-0.25, -0.45, -0.3, 0.1)
+        add_vertices(lines, color, self.instrument_circle(-0.25, -0.45, -0.3, 0.1))
         
         # Vertical speed indicator
-        self.draw_instrument_circle(0.15, -0.45, -0.3, 0.1)
+        add_vertices(lines, color, self.instrument_circle(0.15, -0.45, -0.3, 0.1))
         
         # RPM gauge
-        self.draw_instrument_circle(-0.35, -0.45, -0.3, 0.1)
+        add_vertices(lines, color, self.instrument_circle(-0.35, -0.45, -0.3, 0.1))
         
         # Fuel gauge
-        self.draw_instrument_circle(0.35, -0.45, -0.3, 0.1)
-        glEnd()
-        
-        glEndList()
+        add_vertices(lines, color, self.instrument_circle(0.35, -0.45, -0.3, 0.1))
+        
+        # Upload once: panel quad indices first, then the line indices
+        cockpit_vertices = np.array(vertices, dtype=np.float32)
+        cockpit_indices = np.array(quads + lines, dtype=np.uint16)
+        self.cockpit_quad_count = len(quads)
+        self.cockpit_line_count = len(lines)
+        
+        self.cockpit_vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.cockpit_vbo)
+        glBufferData(GL_ARRAY_BUFFER, cockpit_vertices.nbytes, cockpit_vertices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        
+        self.cockpit_ibo = glGenBuffers(1)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.cockpit_ibo)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, cockpit_indices.nbytes, cockpit_indices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
+    def instrument_circle(self, x, y, z, radius):
+        # Line segment endpoints for an instrument circle, offset from the shared unit ring
+        points = []
+        for (cos1, sin1), (cos2, sin2) in zip(_RING, _RING[1:]):
+            points.append((x + radius * cos1, y, z + radius * sin1))
+            points.append((x + radius * cos2, y, z + radius * sin2))
+        return points
 
-    def draw_instrument_circle(self, x, y, z, radius):
-        # Helper to draw instrument circles
-        segments = 20
-        for i in range(segments):
-            angle1 = 2 * math.pi * i / segments
-            angle2 = 2 * math.pi * (i + 1) / segments
-            glVertex3f(x + radius * math.cos(angle1), y, z + radius * math.sin(angle1))
-            glVertex3f(x + radius * math.cos(angle2), y, z + radius * math.sin(angle2))
+    def draw_cockpit(self):
+        # Draw the panel quad and all cockpit lines from the indexed VBO
+        glBindBuffer(GL_ARRAY_BUFFER, self.cockpit_vbo)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.cockpit_ibo)
+        self.enable_vertex_arrays()
+        
+        index_size = 2  # uint16 indices
+        glDrawElements(GL_QUADS, self.cockpit_quad_count, GL_UNSIGNED_SHORT, ctypes.c_void_p(0))
+        glDrawElements(GL_LINES, self.cockpit_line_count, GL_UNSIGNED_SHORT, ctypes.c_void_p(self.cockpit_quad_count * index_size))
+        
+        self.disable_vertex_arrays()
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
 
     def setup_2d_overlay(self):
-        # Initialize the 2D rendering surface for HUD and instruments
-        self.hud_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        # Allocate the HUD texture once; fields upload only their own region
+        self.hud_tex = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, self.hud_tex)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, WIDTH, HEIGHT, 0, GL_RGBA, GL_UNSIGNED_BYTE, None)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        
+        # 2D orthographic projection with y pointing down, equivalent to
+        # gluOrtho2D(0, WIDTH, HEIGHT, 0), stored column-major for glLoadMatrixf
+        self.hud_projection = np.array([
+            2 / WIDTH, 0, 0, 0,
+            0, -2 / HEIGHT, 0, 0,
+            0, 0, -1, 0,
+            -1, 1, 0, 1,
+        ], dtype=np.float32)
+        
+        # Blend function used for HUD transparency
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        
+        # Start from a fully transparent texture
+        self.upload_hud_region(pygame.Rect(0, 0, WIDTH, HEIGHT), pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA))
+        
+        # Artificial horizon line never changes, so draw it once
+        horizon = pygame.Surface((200, 2), pygame.SRCALPHA)
+        horizon.fill(WHITE)
+        self.upload_hud_region(pygame.Rect(WIDTH // 2 - 100, HEIGHT // 2 - 1, 200, 2), horizon)
+        
+        # Screen region for each HUD field
+        line_height = self.font.get_linesize()
+        self.hud_regions = {
+            'spd': pygame.Rect(50, HEIGHT - 100, 150, line_height),
+            'alt': pygame.Rect(50, HEIGHT - 70, 150, line_height),
+            'hdg': pygame.Rect(50, HEIGHT - 40, 150, line_height),
+            'vs': pygame.Rect(WIDTH - 200, HEIGHT - 100, 150, line_height),
+            'roll': pygame.Rect(WIDTH - 200, HEIGHT - 70, 150, line_height),
+            'pitch': pygame.Rect(WIDTH - 200, HEIGHT - 40, 150, line_height),
+            'rpm': pygame.Rect(WIDTH // 2 - 100, HEIGHT - 70, 150, line_height),
+            'fuel': pygame.Rect(WIDTH // 2 - 100, HEIGHT - 40, 150, line_height),
+            'throttle': pygame.Rect(WIDTH // 2 - 100, HEIGHT - 100, 150, line_height),
+            'stall': pygame.Rect(WIDTH // 2 - 80, 50, 160, line_height),
+            'gear': pygame.Rect(50, HEIGHT - 130, 150, line_height),
+            'flaps': pygame.Rect(WIDTH - 200, HEIGHT - 130, 150, line_height),
+        }
+        self.hud_surfaces = {name: pygame.Surface(rect.size, pygame.SRCALPHA) for name, rect in self.hud_regions.items()}
+        
+        # Fixed label and unit for each numeric field
+        self.hud_labels = {
+            'spd': ("SPD: ", " kts"),
+            'alt': ("ALT: ", " ft"),
+            'hdg': ("HDG: ", "°"),
+            'vs': ("VS: ", " fpm"),
+            'roll': ("BANK: ", "°"),
+            'pitch': ("PITCH: ", "°"),
+            'rpm': ("RPM: ", ""),
+            'fuel': ("FUEL: ", "%"),
+            'throttle': ("THROT: ", "%"),
+        }
+        
+        # Pre-rendered glyphs for digits, minus sign, labels and units, so
+        # numeric fields are assembled by blitting instead of font rendering
+        glyph_texts = set("0123456789-")
+        for label, unit in self.hud_labels.values():
+            glyph_texts.update((label, unit))
+        glyph_texts.discard("")
+        self.glyphs = {text: self.font.render(text, True, WHITE) for text in glyph_texts}
+        
+        # Laid-out glyph offsets per (label, digits), filled on first use
+        self.glyph_offsets = {}
+        
+        # Labels never change, so draw them onto their fields once
+        for name, (label, unit) in self.hud_labels.items():
+            self.hud_surfaces[name].blit(self.glyphs[label], (0, 0))
+        
+        # Last displayed value of each field
+        self.hud_cache = {}
+
+    def upload_hud_region(self, rect, surface):
+        # Copy a surface into its region of the HUD texture
+        data = pygame.image.tostring(surface, "RGBA")
+        glBindTexture(GL_TEXTURE_2D, self.hud_tex)
+        glTexSubImage2D(GL_TEXTURE_2D, 0, rect.x, rect.y, rect.w, rect.h, GL_RGBA, GL_UNSIGNED_BYTE, data)
+
+    def hud_changed(self, name, value):
+        # Record a field's value and report whether it differs from what is shown
+        if self.hud_cache.get(name) == value:
+            return False
+        self.hud_cache[name] = value
+        return True
+
+    def set_hud_text(self, name, text, color=WHITE):
+        # Re-render a HUD field and upload it to the texture
+        surface = self.hud_surfaces[name]
+        surface.fill((0, 0, 0, 0))
+        if text:
+            surface.blit(self.font.render(text, True, color), (0, 0))
+        self.upload_hud_region(self.hud_regions[name], surface)
+
+    def set_hud_number(self, name, value):
+        # Redraw a numeric HUD field's digits and unit from glyphs and upload it
+        label, unit = self.hud_labels[name]
+        surface = self.hud_surfaces[name]
+        x = self.glyphs[label].get_width()
+        surface.fill((0, 0, 0, 0), pygame.Rect(x, 0, surface.get_width() - x, surface.get_height()))
+        
+        # Place each glyph at the laid-out width of the text before it;
+        # summing glyph widths would drop the font's sub-pixel advances
+        digits = str(value)
+        offsets = self.glyph_offsets.get((label, digits))
+        if offsets is None:
+            offsets = tuple(self.font.size(label + digits[:i])[0] for i in range(len(digits) + 1))
+            self.glyph_offsets[(label, digits)] = offsets
+        for char, offset in zip(digits, offsets):
+            surface.blit(self.glyphs[char], (offset, 0))
+        if unit:
+            surface.blit(self.glyphs[unit], (offsets[-1], 0))
+        
+        self.upload_hud_region(self.hud_regions[name], surface)
 
     def update_2d_overlay(self):
-        # Clear the HUD surface
-        self.hud_surface.fill((0, 0, 0, 0))
-        
-        # Draw HUD elements
-        # Artificial horizon line
-        pygame.draw.line(self.hud_surface, WHITE, (WIDTH // 2 - 100, HEIGHT // 2), (WIDTH // 2 + 100, HEIGHT // 2), 2)
+        # Fields are only redrawn when their displayed value changes
         
         # HUD airspeed
-        speed_text = self.font.render(f"SPD: {int(self.aircraft.airspeed / KNOTS_TO_MPS)} kts", True, WHITE)
-        self.hud_surface.blit(speed_text, (50, HEIGHT - 100))
+        speed_kts = int(self.aircraft.airspeed / KNOTS_TO_MPS)
+        if self.hud_changed('spd', speed_kts):
+            self.set_hud_number('spd', speed_kts)
         
         # HUD altitude
         alt_feet = int(self.aircraft.y / FEET_TO_METERS)
-        alt_text = self.font.render(f"ALT: {alt_feet} ft", True, WHITE)
-        self.hud_surface.blit(alt_text, (50, HEIGHT - 70))
+        if self.hud_changed('alt', alt_feet):
+            self.set_hud_number('alt', alt_feet)
         
         # HUD heading
-        hdg_text = self.font.render(f"HDG: {int(self.aircraft.heading)}°", True, WHITE)
-        self.hud_surface.blit(hdg_text, (50, HEIGHT - 40))
+        heading = int(self.aircraft.heading)
+        if self.hud_changed('hdg', heading):
+            self.set_hud_number('hdg', heading)
         
         # HUD vertical speed
         vs_fpm = int(self.aircraft.vertical_speed / FEET_TO_METERS * 60)
-        vs_text = self.font.render(f"VS: {vs_fpm} fpm", True, WHITE)
-        self.hud_surface.blit(vs_text, (WIDTH - 200, HEIGHT - 100))
+        if self.hud_changed('vs', vs_fpm):
+            self.set_hud_number('vs', vs_fpm)
         
         # HUD bank angle
-        roll_text = self.font.render(f"BANK: {int(self.aircraft.roll)}°", True, WHITE)
-        self.hud_surface.blit(roll_text, (WIDTH - 200, HEIGHT - 70))
+        roll = int(self.aircraft.roll)
+        if self.hud_changed('roll', roll):
+            self.set_hud_number('roll', roll)
         
         # HUD pitch
-        pitch_text = self.font.render(f"PITCH: {int(self.aircraft.pitch)}°", True, WHITE)
-        self.hud_surface.blit(pitch_text, (WIDTH - 200, HEIGHT - 40))
+        pitch = int(self.aircraft.pitch)
+        if self.hud_changed('pitch', pitch):
+            self.set_hud_number('pitch', pitch)
         
         # Engine RPM
-        rpm_text = self.font.render(f"RPM: {int(self.aircraft.rpm)}", True, WHITE)
-        self.hud_surface.blit(rpm_text, (WIDTH // 2 - 100, HEIGHT - 70))
+        rpm = int(self.aircraft.rpm)
+        if self.hud_changed('rpm', rpm):
+            self.set_hud_number('rpm', rpm)
         
         # Fuel gauge
-        fuel_text = self.font.render(f"FUEL: {int(self.aircraft.fuel)}%", True, WHITE)
-        self.hud_surface.blit(fuel_text, (WIDTH // 2 - 100, HEIGHT - 40))
+        fuel = int(self.aircraft.fuel)
+        if self.hud_changed('fuel', fuel):
+            self.set_hud_number('fuel', fuel)
         
         # Throttle setting
-        throttle_text = self.font.render(f"THROT: {int(self.aircraft.throttle * 100)}%", True, WHITE)
-        self.hud_surface.blit(throttle_text, (WIDTH // 2 - 100, HEIGHT - 100))
+        throttle = int(self.aircraft.throttle * 100)
+        if self.hud_changed('throttle', throttle):
+            self.set_hud_number('throttle', throttle)
         
         # Stall warning
-        if self.aircraft.airspeed < CESSNA_STALL_SPEED * KNOTS_TO_MPS * 1.1:
-            stall_text = self.font.render("STALL WARNING", True, RED)
-            self.hud_surface.blit(stall_text, (WIDTH // 2 - 80, 50))
+        stall_warning = self.aircraft.airspeed < STALL_MPS_11
+        if self.hud_changed('stall', stall_warning):
+            self.set_hud_text('stall', "STALL WARNING" if stall_warning else "", RED)
             
         # Gear status
-        gear_text = self.font.render("GEAR: DOWN" if self.aircraft.gear_down else "GEAR: UP", True, GREEN if self.aircraft.gear_down else RED)
-        self.hud_surface.blit(gear_text, (50, HEIGHT - 130))
+        if self.hud_changed('gear', self.aircraft.gear_down):
+            self.set_hud_text('gear', "GEAR: DOWN" if self.aircraft.gear_down else "GEAR: UP", GREEN if self.aircraft.gear_down else RED)
         
         # Flaps setting
-        flaps_positions = ["0°", "10°", "20°", "30°"]
-        flaps_text = self.font.render(f"FLAPS: {flaps_positions[self.aircraft.flaps]}", True, WHITE)
-        self.hud_surface.blit(flaps_text, (WIDTH - 200, HEIGHT - 130))
-        
-        # Convert surface to texture for OpenGL
-        self.hud_texture_data = pygame.image.tostring(self.hud_surface, "RGBA", True)
+        if self.hud_changed('flaps', self.aircraft.flaps):
+            flaps_positions = ["0°", "10°", "20°", "30°"]
+            self.set_hud_text('flaps', f"FLAPS: {flaps_positions[self.aircraft.flaps]}")
 
     def draw_2d_overlay(self):
         # Switch to 2D orthographic projection
         glMatrixMode(GL_PROJECTION)
         glPushMatrix()
-        glLoadIdentity()
-        gluOrtho2D(0, WIDTH, HEIGHT, 0)
+        glLoadMatrixf(self.hud_projection)
         
         glMatrixMode(GL_MODELVIEW)
         glPushMatrix()
@@ -458,16 +769,11 @@ class FlightSimulator:
         
         # Enable blend for transparency
         glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-        
-        # Render the HUD as a textured quad
-        texture = glGenTextures(1)
-        glBindTexture(GL_TEXTURE_2D, texture)
-        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, WIDTH, HEIGHT, 0, GL_RGBA, GL_UNSIGNED_BYTE, self.hud_texture_data)
         
+        # Render the HUD as a textured quad, untinted
+        glBindTexture(GL_TEXTURE_2D, self.hud_tex)
         glEnable(GL_TEXTURE_2D)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        glColor3f(1.0, 1.0, 1.0)
         
         # Draw textured quad
         glBegin(GL_QUADS)
@@ -477,7 +783,6 @@ class FlightSimulator:
         glTexCoord2f(0, 1); glVertex2f(0, HEIGHT)
         glEnd()
         
-        glDeleteTextures(1, [texture])
         glDisable(GL_TEXTURE_2D)
         glDisable(GL_BLEND)
         
@@ -500,6 +805,9 @@ class FlightSimulator:
                     self.running = False
                 elif event.key == pygame.K_p:
                     self.paused = not self.paused
+                    # Free the cursor while paused and grab it again on resume
+                    pygame.event.set_grab(not self.paused)
+                    pygame.mouse.get_rel()  # Drop mouse motion made while paused
                 elif event.key == pygame.K_g:
                     # Toggle landing gear
                     self.aircraft.gear_down = not self.aircraft.gear_down
@@ -509,28 +817,22 @@ class FlightSimulator:
                 elif event.key == pygame.K_r:
                     # Reset aircraft
                     self.__init__()
-            
-            elif event.type == pygame.MOUSEMOTION:
-                # Only use mouse motion if not paused
-                if not self.paused:
-                    # Get mouse movement
-                    dx, dy = event.rel
-                    
-                    # Apply to aircraft control (simplified yoke control)
-                    self.aircraft.elevator = -dy * self.mouse_sensitivity / 10
-                    self.aircraft.aileron = dx * self.mouse_sensitivity / 10
-                    
-                    # Recenter mouse to avoid edge limits
-                    pygame.mouse.set_pos((WIDTH // 2, HEIGHT // 2))
-        
-        # Continuous key inputs
-        keys = pygame.key.get_pressed()
+
+    def poll_controls(self, dt, dx, dy, keys):
+        # Apply one physics step's control input; dx, dy is this step's share
+        # of the frame's mouse motion and keys the frame's key state
+        
+        # Mouse motion drives the yoke (simplified yoke control), scaled by
+        # step length to keep the original per-frame tuning
+        mouse_scale = self.mouse_sensitivity / 10 / (FPS * dt)
+        self.aircraft.elevator = max(-1.0, min(1.0, -dy * mouse_scale))
+        self.aircraft.aileron = max(-1.0, min(1.0, dx * mouse_scale))
         
         # Throttle control
         if keys[pygame.K_EQUALS] or keys[pygame.K_PLUS]:
-            self.aircraft.throttle = min(1.0, self.aircraft.throttle + 0.01)
+            self.aircraft.throttle = min(1.0, self.aircraft.throttle + THROTTLE_RATE * dt)
         if keys[pygame.K_MINUS]:
-            self.aircraft.throttle = max(0.0, self.aircraft.throttle - 0.01)
+            self.aircraft.throttle = max(0.0, self.aircraft.throttle - THROTTLE_RATE * dt)
             
         # Rudder control
         if keys[pygame.K_z]:
@@ -545,21 +847,27 @@ class FlightSimulator:
             self.aircraft.elevator = 1.0
         elif keys[pygame.K_DOWN]:
             self.aircraft.elevator = -1.0
-        else:
-            # Only reset if mouse isn't controlling
-            if abs(self.aircraft.elevator) < 0.1:
-                self.aircraft.elevator = 0.0
                 
         if keys[pygame.K_LEFT]:
             self.aircraft.aileron = -1.0
         elif keys[pygame.K_RIGHT]:
             self.aircraft.aileron = 1.0
-        else:
-            # Only reset if mouse isn't controlling
-            if abs(self.aircraft.aileron) < 0.1:
-                self.aircraft.aileron = 0.0
 
-    def render(self):
+    def interpolate_state(self, alpha):
+        # Blend the previous and current physics poses by alpha (0 to 1)
+        current = self.aircraft.snapshot()
+        x, y, z, pitch, roll = (
+            prev + (cur - prev) * alpha
+            for prev, cur in zip(self.previous_state[:5], current[:5])
+        )
+        
+        # Take the short way around when heading wraps past 360
+        heading_diff = (current[5] - self.previous_state[5] + 180) % 360 - 180
+        heading = (self.previous_state[5] + heading_diff * alpha) % 360
+        
+        return x, y, z, pitch, roll, heading
+
+    def render(self, alpha=1.0):
         # Clear the screen and depth buffer
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
         glClearColor(0.5, 0.7, 1.0, 1.0)  # Sky blue clear color
@@ -568,48 +876,89 @@ class FlightSimulator:
         glMatrixMode(GL_MODELVIEW)
         glLoadIdentity()
         
+        # Interpolate the aircraft pose between the last two physics steps
+        x, y, z, pitch, roll, heading = self.interpolate_state(alpha)
+        
         # Calculate camera position and orientation
         # Convert aircraft orientation from degrees to radians
-        heading_rad = math.radians(self.aircraft.heading)
-        pitch_rad = math.radians(self.aircraft.pitch)
-        roll_rad = math.radians(self.aircraft.roll)
-        
-        # Create rotation matrices
-        # Heading rotation (around y-axis)
-        c_h, s_h = math.cos(heading_rad), math.sin(heading_rad)
-        R_heading = np.array([
-            [c_h, 0, -s_h],
-            [0, 1, 0],
-            [s_h, 0, c_h]
-        ])
-        
-        # Pitch rotation (around x-axis)
-        c_p, s_p = math.cos(pitch_rad), math.sin(pitch_rad)
-        R_pitch = np.array([
-            [1, 0, 0],
-            [0, c_p, s_p],
-            [0, -s_p, c_p]
-        ])
-        
-        # Roll rotation (around z-axis)
-        c_r, s_r = math.cos(roll_rad), math.sin(roll_rad)
-        R_roll = np.array([
-            [c_r, s_r, 0],
-            [-s_r, c_r, 0],
-            [0, 0, 1]
-        ])
-        
-        # Combine rotations: first heading, then pitch, then roll
-        R = R_roll @ R_pitch @ R_heading
+        heading_rad = radians(heading)
+        pitch_rad = radians(pitch)
+        roll_rad = radians(roll)
+        
+        c_h, s_h = cos(heading_rad), sin(heading_rad)
+        c_p, s_p = cos(pitch_rad), sin(pitch_rad)
+        c_r, s_r = cos(roll_rad), sin(roll_rad)
+        
+        # Combined rotation R_roll @ R_pitch @ R_heading
+        _, _, _, r10, r11, r12, r20, r21, r22 = _zyx(c_r, s_r, c_p, s_p, c_h, s_h)
+        
+        # Aircraft axes in world space: forward (r20, -r21, r22) follows the
+        # direction of travel in Aircraft.update, and up (-r10, r11, -r12)
+        # tilts towards the lowered wing; both are rows of R with the pitch
+        # axis flipped
+        
+        # Pilot's eye offset (0, 0.1, -0.3) in the same axes, with -z forward
+        # as in the cockpit geometry: 0.1 m up and 0.3 m forward
+        eye_x = x - 0.1 * r10 + 0.3 * r20
+        eye_y = y + 0.1 * r11 - 0.3 * r21
+        eye_z = z - 0.1 * r12 + 0.3 * r22
+        
+        # Look one meter ahead along forward
+        gluLookAt(eye_x, eye_y, eye_z,
+                  eye_x + r20, eye_y - r21, eye_z + r22,
+                  -r10, r11, -r12)
+        
+        # Draw the world
+        self.draw_world()
+        self.draw_runway()
+        
+        # Draw the cockpit in eye space so it stays fixed to the view
+        glLoadIdentity()
+        self.draw_cockpit()
         
-        # Rotate eye offset
-        eye_pos = R @ self.eye_offset
+        # Draw the HUD on top
+        self.update_2d_overlay()
+        self.draw_2d_overlay()
         
-        # Add to aircraft position
-        eye_x = self.aircraft.x + eye_pos[0]
-        eye_y = self.aircraft.y + eye_pos[1]
-        eye_z = self.aircraft.z + eye_pos[2]
+        pygame.display.flip()
+
+    def run(self):
+        # Fixed-timestep loop: physics advances in PHYS_DT steps regardless
+        # of frame rate, and rendering interpolates between the last two steps
+        accumulator = 0.0
+        last_time = time.monotonic()
+        
+        while self.running:
+            now = time.monotonic()
+            frame_time = min(now - last_time, MAX_FRAME_TIME)
+            last_time = now
+            
+            self.handle_input()
+            
+            if not self.paused:
+                accumulator += frame_time
+                steps = int(accumulator / PHYS_DT)
+                if steps:
+                    # Sample input once per frame (handle_input already pumped
+                    # the event queue) and spread the mouse motion evenly over
+                    # the physics steps, so the yoke responds to mouse speed at
+                    # any frame rate
+                    dx, dy = pygame.mouse.get_rel()
+                    step_dx, step_dy = dx / steps, dy / steps
+                    keys = pygame.key.get_pressed()
+                for _ in range(steps):
+                    self.poll_controls(PHYS_DT, step_dx, step_dy, keys)
+                    self.previous_state = self.aircraft.snapshot()
+                    self.aircraft.update(PHYS_DT)
+                    accumulator -= PHYS_DT
+            
+            self.render(accumulator / PHYS_DT)
+            
+            # Cap the render rate; physics timing comes from time.monotonic()
+            self.clock.tick(FPS)
         
-        # Calculate look direction
-        # Forward vector
-        forward = np.
\ No newline at end of file
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    FlightSimulator().run()